@@ -184,6 +184,32 @@ def get_logs_dir():
     return settings.as_dict().get("datadir.paths.logs_dir")
 
 
+def _get_next_logdir_suffix(base_dir, prefix):
+    """
+    Returns the numeric suffix following the highest one in use.
+
+    Instead of probing candidate directories one by one, this goes
+    over the base directory entries once, looking for the ones named
+    as `prefix` followed by a number.
+
+    :param base_dir: directory where the log directories are located
+    :param prefix: the name of the log directory, without the suffix
+    :rtype: int
+    """
+    last = -1
+    try:
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(prefix):
+                    continue
+                suffix = entry.name[len(prefix) :]
+                if suffix.isdecimal():
+                    last = max(last, int(suffix))
+    except OSError:
+        pass
+    return last + 1
+
+
 def create_job_logs_dir(base_dir=None, unique_id=None):
     """
     Create a log directory for a job, or a stand alone execution of a test.
@@ -208,19 +234,23 @@ def create_job_logs_dir(base_dir=None, unique_id=None):
     if unique_id is None:
         unique_id = job_id.create_unique_job_id()
 
+    # mkdir() both probes and claims a name, so concurrent jobs can not
+    # end up with the same directory.  Any error other than the name
+    # being taken would happen on every attempt, so it's not retried.
     logdir = os.path.join(base_dir, f"job-{start_time}-{unique_id[:7]}")
     for i in range(7, len(unique_id)):
         try:
             os.mkdir(logdir)
-        except OSError:
+        except FileExistsError:
             logdir += unique_id[i]
             continue
         return logdir
     logdir += "."
-    for i in range(1000):
+    first = _get_next_logdir_suffix(base_dir, os.path.basename(logdir))
+    for i in range(first, first + 1000):
         try:
             os.mkdir(logdir + str(i))
-        except OSError:
+        except FileExistsError:
             continue
         return logdir + str(i)
     raise IOError(f"Unable to create unique logdir" f" in 1000 iterations: {logdir}")
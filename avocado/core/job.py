@@ -285,6 +285,10 @@ class Job:
         output.del_last_configuration()
 
     def _log_avocado_config(self):
+        # the config is large, so avoid formatting it (and emitting a
+        # record per line) when the job log would discard it anyway
+        if not LOG_JOB.isEnabledFor(logging.INFO):
+            return
         LOG_JOB.info("Avocado config:")
         LOG_JOB.info("")
         for line in pprint.pformat(self.config).splitlines():
@@ -340,6 +344,8 @@ class Job:
 
     @staticmethod
     def _log_variants(variants):
+        if not LOG_JOB.isEnabledFor(logging.INFO):
+            return
         lines = variants.to_str(summary=1, variants=1, use_utf8=False)
         for line in lines.splitlines():
             LOG_JOB.info(line)
@@ -150,15 +150,18 @@ def retrieve_cmdline(resultsdir):
             ) as log:
                 import re
 
-                cmd = re.search(
+                pattern = re.compile(
                     r"# \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} "
-                    r"\w{17}\w\d{4} INFO | Command line: (.*)",
-                    log.read(),
+                    r"\w{17}\w\d{4} INFO | Command line: (.*)"
                 )
-                if cmd:
-                    import shlex
-
-                    return shlex.split(cmd.group(1))
+                # the command line is logged early, so avoid reading
+                # the (possibly huge) log file as a whole
+                for line in log:
+                    cmd = pattern.search(line)
+                    if cmd:
+                        import shlex
+
+                        return shlex.split(cmd.group(1))
         except IOError:
             pass
         return None
@@ -706,8 +706,10 @@ def add_log_handler(
         handler.addFilter(handler_filter)
 
     if klass == logging.FileHandler and buffer_size > 0:
-        buffered_wrapper = logging.handlers.MemoryHandler(buffer_size)
-        buffered_wrapper.setTarget(handler)
+        buffered_wrapper = logging.handlers.MemoryHandler(buffer_size, target=handler)
+        # records that the target would discard should not take up
+        # room in the buffer (and trigger early flushes)
+        buffered_wrapper.setLevel(level)
         handler = buffered_wrapper
 
     logger.addHandler(handler)
@@ -720,9 +722,10 @@ def disable_log_handler(logger):
         return
     if isinstance(logger, str):
         logger = logging.getLogger(logger)
-    # Handlers might be reused elsewhere, can't delete them
+    # Handlers might be reused elsewhere, can't delete them, but
+    # buffered content must reach its destination before detaching
     while logger.handlers:
-        logger.handlers.pop()
+        logger.handlers.pop().flush()
     logger.handlers.append(logging.NullHandler())
 
 
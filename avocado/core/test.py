@@ -242,6 +242,8 @@ class Test(unittest.TestCase, TestData):
     actual_time_end = -1
     #: Test timeout (the timeout from params takes precedence)
     timeout = None
+    #: Logger shared by all test instances, available as :attr:`log`
+    __log = logging.getLogger("avocado.test")
 
     def __init__(
         self,
@@ -270,6 +272,12 @@ class Test(unittest.TestCase, TestData):
         :type config: dict
         """
         self.__phase = "INIT"
+        # released by _cleanup(), which also runs if the initialization fails
+        self.__base_logdir_tmp = None
+        self.__base_tmpdir = None  # initialized lazily
+
+        # validates methodName, so do it before allocating any resources
+        unittest.TestCase.__init__(self, methodName=methodName)
 
         def record_and_warn(*args, **kwargs):
             """Record call to this function and log warning"""
@@ -287,22 +295,23 @@ class Test(unittest.TestCase, TestData):
         self._config = config or settings.as_dict()
 
         self.__base_logdir = base_logdir
-        self.__base_logdir_tmp = None
         if self.__base_logdir is None:
             prefix = "avocado_test_"
             self.__base_logdir_tmp = tempfile.TemporaryDirectory(prefix=prefix)
             self.__base_logdir = self.__base_logdir_tmp.name
+        else:
+            # the output dir is only created on first use, but the
+            # logdir itself is expected to exist (e.g. by the workdir)
+            utils_path.init_dir(self.__base_logdir)
 
-        self.__logfile = os.path.join(self.logdir, "debug.log")
+        logdir = self.logdir
+        self.__logfile = os.path.join(logdir, "debug.log")
 
-        self._stdout_file = os.path.join(self.logdir, "stdout")
-        self._stderr_file = os.path.join(self.logdir, "stderr")
-        self._output_file = os.path.join(self.logdir, "output")
+        self._stdout_file = os.path.join(logdir, "stdout")
+        self._stderr_file = os.path.join(logdir, "stderr")
+        self._output_file = os.path.join(logdir, "output")
         self._logging_handlers = {}
 
-        self.__outputdir = utils_path.init_dir(self.logdir, "data")
-
-        self.__log = logging.getLogger("avocado.test")
         original_log_warn = self.log.warning
         self.__log_warn_used = False
         self.log.warn = self.log.warning = record_and_warn
@@ -330,8 +339,8 @@ class Test(unittest.TestCase, TestData):
 
         # Are initialized lazily
         self.__cache_dirs = None
-        self.__base_tmpdir = None
         self.__workdir = None
+        self.__outputdir = None
 
         self.__running = False
         self.paused = False
@@ -350,7 +359,6 @@ class Test(unittest.TestCase, TestData):
         self.log.debug("  timeout factor: %s", timeout_factor)
         self.log.debug("  actual timeout: %s", self.timeout)
 
-        unittest.TestCase.__init__(self, methodName=methodName)
         TestData.__init__(self)
 
     @property
@@ -403,6 +411,8 @@ class Test(unittest.TestCase, TestData):
         """
         Directory available to test writers to attach files to the results
         """
+        if self.__outputdir is None:
+            self.__outputdir = utils_path.init_dir(self.logdir, "data")
         return self.__outputdir
 
     @property
@@ -608,10 +618,13 @@ class Test(unittest.TestCase, TestData):
                 details = sys.exc_info()[1]
                 if not isinstance(details, Exception):  # Avoid passing nasty exc
                     details = exceptions.TestError(f"{details!r}: {details}")
-                self.log.debug("Local variables:")
-                local_vars = inspect.trace()[1][0].f_locals
-                for key, value in local_vars.items():
-                    self.log.debug(" -> %s %s: %s", key, type(value), value)
+                # inspect.trace() walks (and reads the source of) every
+                # frame, so only do it when the result is going to be logged
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug("Local variables:")
+                    local_vars = inspect.trace()[1][0].f_locals
+                    for key, value in local_vars.items():
+                        self.log.debug(" -> %s %s: %s", key, type(value), value)
                 raise details
 
         self.__status = "PASS"
@@ -652,6 +665,18 @@ class Test(unittest.TestCase, TestData):
         os.environ["AVOCADO_TEST_LOGFILE"] = self.logfile
         os.environ["AVOCADO_TEST_OUTPUTDIR"] = self.outputdir
 
+    def _capture_traceback(self):
+        """
+        Records the traceback of the exception currently being handled.
+
+        :returns: the formatted traceback entries, as given by
+                  :func:`avocado.utils.stacktrace.tb_info`
+        :rtype: list of str
+        """
+        tb_info = stacktrace.tb_info(sys.exc_info())
+        self.__traceback = "".join(tb_info)
+        return tb_info
+
     def _catch_test_status(self, method):
         """Wrapper around test methods for catching and logging failures."""
         try:
@@ -662,20 +687,15 @@ class Test(unittest.TestCase, TestData):
                     "during execution. Check the log for "
                     "details."
                 )
-        except exceptions.TestBaseException as detail:
-            self.__status = detail.status
-            self.__fail_class = detail.__class__.__name__
-            self.__fail_reason = astring.to_text(detail)
-            self.__traceback = stacktrace.prepare_exc_info(sys.exc_info())
-        except AssertionError as detail:
-            self.__status = "FAIL"
+        except (exceptions.TestBaseException, AssertionError) as detail:
+            # plain assertion errors carry no status of their own
+            self.__status = getattr(detail, "status", "FAIL")
             self.__fail_class = detail.__class__.__name__
             self.__fail_reason = astring.to_text(detail)
-            self.__traceback = stacktrace.prepare_exc_info(sys.exc_info())
+            self._capture_traceback()
         except Exception as detail:  # pylint: disable=W0703
             self.__status = "ERROR"
-            tb_info = stacktrace.tb_info(sys.exc_info())
-            self.__traceback = stacktrace.prepare_exc_info(sys.exc_info())
+            tb_info = self._capture_traceback()
             try:
                 self.__fail_class = astring.to_text(detail.__class__.__name__)
                 self.__fail_reason = astring.to_text(detail)
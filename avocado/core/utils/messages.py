@@ -170,6 +170,12 @@ _supported_types = {
 }
 
 
+#: Formatter shared by all the handlers set up by :func:`start_logging`
+_LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(name)s %(module)-16.16s L%(lineno)-.4d %(levelname)-5.5s| %(message)s"
+)
+
+
 class RunnerLogHandler(logging.Handler):
     def __init__(self, queue, message_type, kwargs=None):
         """
@@ -249,11 +255,9 @@ def start_logging(config, queue):
     log_handler = RunnerLogHandler(queue, "log")
     stdout_handler = RunnerLogHandler(queue, "stdout")
     stderr_handler = RunnerLogHandler(queue, "stderr")
-    fmt = "%(asctime)s %(name)s %(module)-16.16s L%(lineno)-.4d %(levelname)-5.5s| %(message)s"
-    formatter = logging.Formatter(fmt=fmt)
-    log_handler.setFormatter(formatter)
-    stdout_handler.setFormatter(formatter)
-    stderr_handler.setFormatter(formatter)
+    log_handler.setFormatter(_LOG_FORMATTER)
+    stdout_handler.setFormatter(_LOG_FORMATTER)
+    stderr_handler.setFormatter(_LOG_FORMATTER)
 
     # root log
     logger = logging.getLogger("")
@@ -284,7 +288,7 @@ def start_logging(config, queue):
             level = log_level
             log_path = f"{enabled_logger}.log"
         store_stream_handler = RunnerLogHandler(queue, "file", {"path": log_path})
-        store_stream_handler.setFormatter(formatter)
+        store_stream_handler.setFormatter(_LOG_FORMATTER)
         output_logger = logging.getLogger(enabled_logger)
         output_logger.addHandler(store_stream_handler)
         output_logger.setLevel(level)
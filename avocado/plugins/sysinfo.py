@@ -14,6 +14,8 @@
 """
 System information plugin
 """
+import os
+
 from avocado.core import sysinfo
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.plugin_interfaces import (
@@ -206,6 +208,36 @@ class SysInfoTest(PreTest, PostTest):
     name = "sysinfo"
     description = "Collects system information before/after the test is run."
 
+    #: Collectibles configuration, along with the files (and their
+    #: modification times) it was read from.  The plugin is instantiated
+    #: for every test, so this is kept at the class level to avoid
+    #: reading the same files again for each test.  Only the last one
+    #: is kept.
+    _COLLECTIBLES_CACHE = (None, None)
+
+    @staticmethod
+    def _collectibles_key(config):
+        key = []
+        for collectible in ["commands", "files", "fail_commands", "fail_files"]:
+            path = config.get(f"sysinfo.collectibles.{collectible}")
+            try:
+                stat = os.stat(path)
+                # the size also catches edits made within the timestamp
+                # granularity of the filesystem
+                state = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                state = None
+            key.append((path, state))
+        return tuple(key)
+
+    def _gather_collectibles_config(self, config):
+        key = self._collectibles_key(config)
+        cached_key, cached_config = SysInfoTest._COLLECTIBLES_CACHE
+        if key != cached_key:
+            cached_config = sysinfo.gather_collectibles_config(config)
+            SysInfoTest._COLLECTIBLES_CACHE = (key, cached_config)
+        return cached_config
+
     def _is_sysinfo_enabled(self, config):
         if not (
             config.get("sysinfo.collect.enabled")
@@ -218,7 +250,7 @@ class SysInfoTest(PreTest, PostTest):
         suite_config = suite_config or {}
         if not self._is_sysinfo_enabled(suite_config):
             return []
-        sysinfo_config = sysinfo.gather_collectibles_config(suite_config)
+        sysinfo_config = self._gather_collectibles_config(suite_config)
         return [
             Runnable(
                 "sysinfo",
@@ -234,7 +266,7 @@ class SysInfoTest(PreTest, PostTest):
         suite_config = suite_config or {}
         if not self._is_sysinfo_enabled(suite_config):
             return []
-        sysinfo_config = sysinfo.gather_collectibles_config(suite_config)
+        sysinfo_config = self._gather_collectibles_config(suite_config)
         return [
             (
                 Runnable(
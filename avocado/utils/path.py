@@ -70,8 +70,7 @@ def init_dir(*args):
     :rtype: str
     """
     directory = os.path.join(*args)
-    if not os.path.isdir(directory):
-        os.makedirs(directory, exist_ok=True)
+    os.makedirs(directory, exist_ok=True)
     return directory
 
 
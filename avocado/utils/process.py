@@ -673,6 +673,11 @@ class SubProcess:
 
         self.start_time = time.monotonic()  # pylint: disable=W0201
 
+        # the output is logged line by line at DEBUG level, so don't go
+        # through it when those records would be discarded anyway.  The
+        # logger level is only checked here, when the process starts.
+        log_output = self.verbose and self.logger.isEnabledFor(logging.DEBUG)
+
         # prepare fd drainers
         self._stdout_drainer = FDDrainer(
             self._popen.stdout.fileno(),
@@ -682,7 +687,7 @@ class SubProcess:
             logger_prefix="[stdout] %s",
             stream_logger=None,
             ignore_bg_processes=self._ignore_bg_processes,
-            verbose=self.verbose,
+            verbose=log_output,
         )
         self._stderr_drainer = FDDrainer(
             self._popen.stderr.fileno(),
@@ -692,7 +697,7 @@ class SubProcess:
             logger_prefix="[stderr] %s",
             stream_logger=None,
             ignore_bg_processes=self._ignore_bg_processes,
-            verbose=self.verbose,
+            verbose=log_output,
         )
 
         # start stdout/stderr threads
@@ -91,6 +91,23 @@ class DataDirTest(Base):
             path = data_dir.create_job_logs_dir(logdir, uid)
             self.assertEqual(path, path_prefix + uid + ".1")
             self.assertTrue(os.path.exists(path))
+            os.mkdir(path_prefix + uid + ".5")
+            path = data_dir.create_job_logs_dir(logdir, uid)
+            self.assertEqual(path, path_prefix + uid + ".6")
+            self.assertTrue(os.path.exists(path))
+
+    def test_unique_log_dir_error(self):
+        """
+        Tests that errors other than an existing logdir are not retried.
+        """
+        from avocado.core import data_dir
+
+        with unittest.mock.patch(
+            "avocado.core.data_dir.os.mkdir", side_effect=PermissionError
+        ) as mocked_mkdir:
+            with self.assertRaises(PermissionError):
+                data_dir.create_job_logs_dir(self.mapping["base_dir"], "1234567890" * 4)
+            mocked_mkdir.assert_called_once()
 
     def test_get_job_results_dir(self):
         from avocado.core import data_dir, job_id
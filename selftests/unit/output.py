@@ -1,8 +1,12 @@
+import logging
+import logging.handlers
+import os
 import sys
 import unittest.mock
 
 from avocado.core import output
 from avocado.utils import path as utils_path
+from selftests.utils import TestCaseTmpDir
 
 
 class TestStdOutput(unittest.TestCase):
@@ -27,5 +31,35 @@ class TestStdOutput(unittest.TestCase):
         self.assertEqual(self.stderr, sys.stderr)
 
 
+class TestLogHandler(TestCaseTmpDir):
+    def test_buffered_file_handler(self):
+        # keep the handler out of the global logging configuration
+        patcher = unittest.mock.patch.object(output, "CONFIG", [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        logger = logging.getLogger("avocado.selftests.output.buffered")
+        logger.setLevel(logging.DEBUG)
+        logfile = os.path.join(self.tmpdir.name, "buffered.log")
+        handler = output.add_log_handler(
+            logger,
+            logging.FileHandler,
+            logfile,
+            logging.INFO,
+            "%(message)s",
+            buffer_size=10,
+        )
+        self.assertIsInstance(handler, logging.handlers.MemoryHandler)
+        logger.debug("filtered out")
+        logger.info("buffered")
+        self.assertEqual(len(handler.buffer), 1)
+        with open(logfile, encoding="utf-8") as log:
+            self.assertEqual(log.read(), "")
+        output.disable_log_handler(logger)
+        with open(logfile, encoding="utf-8") as log:
+            self.assertEqual(log.read(), "buffered\n")
+        handler.target.close()
+        handler.close()
+
+
 if __name__ == "__main__":
     unittest.main()
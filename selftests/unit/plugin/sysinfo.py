@@ -0,0 +1,61 @@
+"""
+Sysinfo plugin unit tests
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from avocado.core import sysinfo
+from avocado.core.nrunner.runnable import Runnable
+from avocado.plugins.sysinfo import SysInfoTest
+from selftests.utils import TestCaseTmpDir
+
+
+class SysInfoTestPlugin(TestCaseTmpDir):
+    """
+    Unit tests for the per-test sysinfo plugin
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.config = {
+            "sysinfo.collect.enabled": True,
+            "sysinfo.collect.per_test": True,
+        }
+        for collectible in ["commands", "files", "fail_commands", "fail_files"]:
+            path = os.path.join(self.tmpdir.name, collectible)
+            with open(path, "w", encoding="utf-8") as collectible_file:
+                collectible_file.write(f"{collectible}\n")
+            self.config[f"sysinfo.collectibles.{collectible}"] = path
+        patcher = patch.object(SysInfoTest, "_COLLECTIBLES_CACHE", (None, None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _pre_test_sysinfo(self):
+        test_runnable = Runnable("noop", None)
+        runnables = SysInfoTest().pre_test_runnables(test_runnable, self.config)
+        return runnables[0].kwargs.get("sysinfo")
+
+    def test_collectibles_read_once(self):
+        with patch(
+            "avocado.plugins.sysinfo.sysinfo.gather_collectibles_config",
+            wraps=sysinfo.gather_collectibles_config,
+        ) as mocked_gather:
+            for _ in range(3):
+                self.assertEqual(self._pre_test_sysinfo()["commands"], ["commands"])
+            mocked_gather.assert_called_once()
+
+    def test_collectibles_changed(self):
+        self.assertEqual(self._pre_test_sysinfo()["commands"], ["commands"])
+        path = self.config["sysinfo.collectibles.commands"]
+        stat = os.stat(path)
+        with open(path, "w", encoding="utf-8") as collectible_file:
+            collectible_file.write("uname -a -p\n")
+        # an edit within the same timestamp tick must also be noticed
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self._pre_test_sysinfo()["commands"], ["uname -a -p"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,33 +5,23 @@ from avocado.core.nrunner.runnable import Runnable
 from avocado.plugins.runners.asset import AssetRunner
 
 
+def _run(**kwargs):
+    """Runs an asset runnable and returns all of its messages"""
+    runnable = Runnable(kind="asset", uri=None, **kwargs)
+    return list(AssetRunner().run(runnable))
+
+
 class BasicTests(unittest.TestCase):
     """Basic unit tests for the AssetRunner class"""
 
     def test_no_kwargs(self):
-        runnable = Runnable(kind="asset", uri=None)
-        runner = AssetRunner()
-        status = runner.run(runnable)
-        messages = []
-        while True:
-            try:
-                messages.append(next(status))
-            except StopIteration:
-                break
+        messages = _run()
         self.assertEqual(messages[-1]["result"], "error")
         stderr = b"At least name should be passed as kwargs"
         self.assertIn(stderr, messages[-2]["log"])
 
     def test_wrong_name(self):
-        runnable = Runnable(kind="asset", uri=None, **{"name": "foo"})
-        runner = AssetRunner()
-        status = runner.run(runnable)
-        messages = []
-        while True:
-            try:
-                messages.append(next(status))
-            except StopIteration:
-                break
+        messages = _run(name="foo")
         self.assertEqual(messages[-1]["result"], "error")
         stderr = b"Failed to fetch foo ("
         self.assertIn(stderr, messages[-2]["log"])
@@ -50,15 +40,7 @@ class FetchTests(unittest.TestCase):
     def test_success_fetch(self):
 
         self.mock_asset.return_value.fetch.return_value = "/tmp/asset.txt"
-        runnable = Runnable(kind="asset", uri=None, **{"name": "asset.txt"})
-        runner = AssetRunner()
-        status = runner.run(runnable)
-        messages = []
-        while True:
-            try:
-                messages.append(next(status))
-            except StopIteration:
-                break
+        messages = _run(name="asset.txt")
         self.assertEqual(messages[-1]["result"], "pass")
         stdout = b"File fetched at /tmp/asset.txt"
         self.assertIn(stdout, messages[-3]["log"])
@@ -68,15 +50,7 @@ class FetchTests(unittest.TestCase):
         self.mock_asset.return_value.fetch = lambda: (_ for _ in ()).throw(
             OSError("Failed to fetch asset.txt")
         )
-        runnable = Runnable(kind="asset", uri=None, **{"name": "asset.txt"})
-        runner = AssetRunner()
-        status = runner.run(runnable)
-        messages = []
-        while True:
-            try:
-                messages.append(next(status))
-            except StopIteration:
-                break
+        messages = _run(name="asset.txt")
         self.assertEqual(messages[-1]["result"], "error")
         stderr = b"Failed to fetch asset.txt"
         self.assertIn(stderr, messages[-2]["log"])
@@ -139,6 +139,27 @@ class TestClassTestUnit(unittest.TestCase):
         self.assertRaises(AttributeError, setattr, dummy_test, "name", "whatever")
         self.assertRaises(AttributeError, setattr, dummy_test, "status", "whatever")
 
+    def test_invalid_method_name(self):
+        with unittest.mock.patch(
+            "avocado.core.test.tempfile.TemporaryDirectory"
+        ) as mocked_tmp_dir:
+            with self.assertRaises(ValueError):
+                self.DummyTest("no_such_method")
+            mocked_tmp_dir.assert_not_called()
+
+    def test_outputdir_lazy(self):
+        dummy_test = self.DummyTest(base_logdir=self.tmpdir.name)
+        outputdir = os.path.join(self.tmpdir.name, "data")
+        self.assertFalse(os.path.exists(outputdir))
+        self.assertEqual(dummy_test.outputdir, outputdir)
+        self.assertTrue(os.path.isdir(outputdir))
+
+    def test_workdir_missing_base_logdir(self):
+        base_logdir = os.path.join(self.tmpdir.name, "not", "yet")
+        dummy_test = self.DummyTest(base_logdir=base_logdir)
+        self.assertTrue(os.path.isdir(base_logdir))
+        self.assertTrue(os.path.isdir(dummy_test.workdir))
+
 
 class TestClassTest(unittest.TestCase):
     def setUp(self):
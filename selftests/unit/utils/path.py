@@ -2,6 +2,7 @@ import os
 import unittest.mock
 
 from avocado.utils import path
+from selftests.utils import TestCaseTmpDir
 
 
 class Path(unittest.TestCase):
@@ -35,5 +36,16 @@ class Path(unittest.TestCase):
         self.assertEqual(path.get_path_mount_point("/"), "/")
 
 
+class InitDir(TestCaseTmpDir):
+    def test_init_dir(self):
+        directory = path.init_dir(self.tmpdir.name, "foo", "bar")
+        self.assertEqual(directory, os.path.join(self.tmpdir.name, "foo", "bar"))
+        self.assertTrue(os.path.isdir(directory))
+
+    def test_init_dir_existing(self):
+        self.assertEqual(path.init_dir(self.tmpdir.name), self.tmpdir.name)
+        self.assertTrue(os.path.isdir(self.tmpdir.name))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import io
 import logging
+import logging.handlers
 import os
 import sys
 import time
@@ -535,6 +536,31 @@ class MiscProcessTests(unittest.TestCase):
         with self.assertRaises(process.CmdInputError):
             process.run("")
 
+    @staticmethod
+    def _run_echo_logged(level):
+        logger = logging.getLogger(f"MiscProcessTests.echo_logged.{level}")
+        logger.setLevel(level)
+        handler = logging.handlers.BufferingHandler(capacity=100)
+        logger.addHandler(handler)
+        try:
+            result = process.SubProcess(f"{ECHO_CMD} foo", logger=logger).run()
+        finally:
+            logger.removeHandler(handler)
+        messages = [record.getMessage() for record in handler.buffer]
+        return result, messages
+
+    @unittest.skipUnless(ECHO_CMD, "Echo command not available in system")
+    def test_output_not_logged_above_debug(self):
+        result, messages = self._run_echo_logged(logging.INFO)
+        self.assertEqual(result.stdout_text, "foo\n")
+        self.assertNotIn("[stdout] foo", messages)
+
+    @unittest.skipUnless(ECHO_CMD, "Echo command not available in system")
+    def test_output_logged_at_debug(self):
+        result, messages = self._run_echo_logged(logging.DEBUG)
+        self.assertEqual(result.stdout_text, "foo\n")
+        self.assertIn("[stdout] foo", messages)
+
 
 class CmdResultTests(unittest.TestCase):
     def test_nasty_str(self):